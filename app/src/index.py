@@ -9,12 +9,26 @@ completing tasks and having nothing to procrastinate on. Use at your own risk.
 """
 import argparse  # Because manually parsing command line args is for cave people
 import datetime  # Time is just a social construct anyway
-import json  # JavaScript Object Notation? More like "Just Store Our Nonsense"
+import orjson  # Like json, but written in Rust so it's automatically 5x faster and 10x smugger
 import os  # "os" stands for "Oh Snap, another system call"
+import secrets  # Random hex straight from the tap, no UUID ceremony required
 import sys  # For when you absolutely, positively need to rage quit
-import uuid  # Universal Unique ID, or "Unbelievably Useless ID" for short
 from enum import Enum  # For when you're too lazy to use constants like a normal person
-from typing import Dict, List, Optional, Union  # Type hints: because we don't trust our future selves
+from typing import Dict, List, Optional, Set, Union  # Type hints: because we don't trust our future selves
+
+from sortedcontainers import SortedList  # A list that stays sorted so we don't have to
+
+try:
+    import numpy as np  # Column-store filtering at SIMD speed, if the heavy artillery is around
+except ImportError:
+    np = None  # No numpy, no vectorized path; the set indexes soldier on alone
+
+try:
+    import msgspec  # Typed decoding: schema validation at parse speed, not after it
+except ImportError:
+    msgspec = None  # orjson carries the load alone; it's used to it
+
+import _fast_iso  # Batch timestamp parsing; secretly Numba-powered if numba is installed
 
 
 class Priority(Enum):
@@ -39,10 +53,58 @@ class Status(Enum):
         return self.name  # For when you want to show off your enum values to your friends
 
 
+# Hoisted enum lookup tables: Enum.__getitem__ walks the member map on every call,
+# and these maps never change, so we grab them once and stop paying the toll.
+_PRIO = Priority.__members__
+_STATUS = Status.__members__
+_PRIORITY_CHOICES = list(_PRIO)  # For argparse, so we don't rebuild the same list four times
+_STATUS_CHOICES = list(_STATUS)
+_PRIO_ORDER = {name: member.value for name, member in _PRIO.items()}  # Name -> rank, for sorting raw records
+
+
+def _parse_due(s: str) -> datetime.datetime:
+    """Parse a 'YYYY-MM-DD HH:MM' string the fast way.
+
+    strptime re-interprets the format string on every single call, which is
+    absurd when the format never changes. We check the shape ourselves (so the
+    CLI stays exactly as picky as it always was) and hand the digit crunching
+    to fromisoformat, which is C code on 3.11+ and accepts the space separator
+    natively. Raises ValueError on anything that isn't precisely the
+    advertised format, because flexibility is for the weak.
+    """
+    if len(s) != 16 or s[4] != '-' or s[7] != '-' or s[10] != ' ' or s[13] != ':':
+        raise ValueError(f"not in 'YYYY-MM-DD HH:MM' format: {s!r}")
+    return datetime.datetime.fromisoformat(s)
+
+
+# The end of time, hoisted to a constant so the sort key doesn't chase two
+# attribute lookups per comparison just to learn that procrastination is eternal.
+_MAXDT = datetime.datetime.max
+
+# For quantizing due dates into int64 microseconds-since-epoch: integer
+# comparisons sort at C speed, and a missing due date becomes "the heat death
+# of the universe" without any datetime object getting hurt.
+_EPOCH = datetime.datetime(1970, 1, 1)
+_USEC = datetime.timedelta(microseconds=1)
+_NO_DUE = (_MAXDT - _EPOCH) // _USEC
+
+
+def _sort_key(t: 'Task'):
+    """Composite ordering key: highest priority first, earliest due date first,
+    id as the tiebreaker so the order is stable and nobody files a bug about it."""
+    return (-t.priority.value, t.due_date or _MAXDT, t.id)
+
+
 class Task:
-    """Represents a single task in the TODO system, or as I like to call it, 
+    """Represents a single task in the TODO system, or as I like to call it,
     'that thing you'll probably never actually do'"""
 
+    # No per-instance __dict__: nine fixed slots instead of a ~280-byte dict per
+    # task. Attribute access becomes a C-level offset too, which the sort keys
+    # and filter paths hit constantly. Your tasks stay heavy; their objects don't.
+    __slots__ = ('id', 'title', 'description', 'priority', 'due_date',
+                 'status', 'tags', 'created_at', 'updated_at')
+
     def __init__(
         self,
         title: str,  # What you pretend this task is about
@@ -53,7 +115,7 @@ class Task:
         tags: List[str] = None,  # For pretending you have an organization system
         task_id: Optional[str] = None  # A unique ID no one will ever look at
     ):
-        self.id = task_id or str(uuid.uuid4())  # Generate a random ID that's impossible to memorize
+        self.id = task_id or secrets.token_hex(16)  # 32 random hex chars, still impossible to memorize, now cheaper to mint
         self.title = title
         self.description = description
         self.priority = priority
@@ -70,7 +132,8 @@ class Task:
         priority: Optional[Priority] = None,  # Probably increasing this as the deadline approaches
         due_date: Optional[datetime.datetime] = None,  # Pushing this back for the 5th time
         status: Optional[Status] = None,  # Changing from NOT_STARTED to... NOT_STARTED
-        tags: Optional[List[str]] = None  # New tags to make it look like you have a system
+        tags: Optional[List[str]] = None,  # New tags to make it look like you have a system
+        now: Optional[datetime.datetime] = None  # Pre-fetched timestamp, so batch updates share one clock read
     ) -> None:
         """Update task attributes, AKA 'moving the goalposts'"""
         if title is not None:
@@ -85,7 +148,7 @@ class Task:
             self.status = status
         if tags is not None:
             self.tags = tags
-        self.updated_at = datetime.datetime.now()  # Timestamp your procrastination
+        self.updated_at = now or datetime.datetime.now()  # Timestamp your procrastination
 
     def to_dict(self) -> Dict:
         """Convert task to dictionary for serialization, because JSON is 'hip' and 'cool'"""
@@ -94,30 +157,53 @@ class Task:
             "title": self.title,
             "description": self.description,
             "priority": self.priority.name,
-            "due_date": self.due_date.isoformat() if self.due_date else None,
+            "due_date": self.due_date,  # orjson speaks datetime natively, no isoformat() middleman needed
             "status": self.status.name,
             "tags": self.tags,
-            "created_at": self.created_at.isoformat(),
-            "updated_at": self.updated_at.isoformat()
+            "created_at": self.created_at,
+            "updated_at": self.updated_at
         }
 
     @classmethod
     def from_dict(cls, data: Dict) -> 'Task':
-        """Create a Task instance from a dictionary, because object-oriented programming is too mainstream"""
-        due_date = None
-        if data.get("due_date"):
-            due_date = datetime.datetime.fromisoformat(data["due_date"])  # Parse ISO format because regular dates are too simple
-        
-        return cls(
-            title=data["title"],
-            description=data["description"],
-            priority=Priority[data["priority"]],  # Enum lookup: what could possibly go wrong?
-            due_date=due_date,
-            status=Status[data["status"]],
-            tags=data["tags"],
-            task_id=data["id"]
+        """Rehydrate a Task from a dictionary, skipping __init__ entirely.
+
+        Going through __init__ would stamp a fresh datetime.now() over the stored
+        created_at/updated_at (rewriting history, but not in the fun way) and burn
+        a random ID we'd immediately throw away. __new__ plus direct assignment
+        keeps the loaded timestamps and skips both per task.
+        """
+        due = data.get("due_date")
+        return cls._hydrate(
+            data,
+            datetime.datetime.fromisoformat(due) if due else None,  # C-accelerated in 3.11+
+            datetime.datetime.fromisoformat(data["created_at"]),
+            datetime.datetime.fromisoformat(data["updated_at"])
         )
 
+    @classmethod
+    def _hydrate(
+        cls,
+        data: Dict,
+        due_date: Optional[datetime.datetime],
+        created_at: datetime.datetime,
+        updated_at: datetime.datetime
+    ) -> 'Task':
+        """Assemble a Task from a record plus already-parsed timestamps.
+        Split out from from_dict so bulk loading can batch-parse the timestamp
+        columns first and hand us the finished datetimes."""
+        obj = cls.__new__(cls)  # A Task with no past, which we're about to give it
+        obj.id = data["id"]
+        obj.title = data["title"]
+        obj.description = data["description"]
+        obj.priority = _PRIO[data["priority"]]  # Cached map lookup: what could possibly go wrong?
+        obj.due_date = due_date
+        obj.status = _STATUS[data["status"]]
+        obj.tags = data["tags"]
+        obj.created_at = created_at  # The actual moment of the promise
+        obj.updated_at = updated_at  # The actual last lie
+        return obj
+
     def __str__(self) -> str:
         """String representation of a task, as if anyone would ever print() a Task object"""
         due_str = f" (Due: {self.due_date.strftime('%Y-%m-%d %H:%M')})" if self.due_date else ""
@@ -126,20 +212,191 @@ class Task:
                 f"  {self.description}")
 
 
+# Compact output is both faster to encode and fewer bytes to write; set
+# TODO_PRETTY=1 if you're the kind of person who reads tasks.json in bed.
+_DUMP_OPTS = orjson.OPT_INDENT_2 if os.environ.get("TODO_PRETTY") == "1" else 0
+
+if msgspec is not None:
+
+    class _TaskRec(msgspec.Struct):
+        """On-disk shape of one task record, so msgspec can decode straight into
+        typed structs instead of generic dicts -- faster, and malformed stores
+        get rejected during the parse rather than halfway through hydration."""
+        id: str
+        title: str
+        description: str
+        priority: str
+        status: str
+        tags: List[str]
+        created_at: str
+        updated_at: str
+        due_date: Optional[str] = None
+
+    class _StoreRec(msgspec.Struct):
+        tasks: List[_TaskRec] = []
+
+    _STORE_DECODER = msgspec.json.Decoder(_StoreRec)  # Compiled once, like all good decoders
+
+    def _decode_records(buf: bytes) -> List[Dict]:
+        """Decode the raw store bytes into task record dicts, schema-checked."""
+        return [msgspec.structs.asdict(rec) for rec in _STORE_DECODER.decode(buf).tasks]
+
+    _DECODE_ERRORS = (msgspec.DecodeError, orjson.JSONDecodeError, KeyError)
+
+else:
+
+    def _decode_records(buf: bytes) -> List[Dict]:
+        """Decode the raw store bytes into task record dicts, the orjson way."""
+        return orjson.loads(buf).get("tasks", [])
+
+    _DECODE_ERRORS = (orjson.JSONDecodeError, KeyError)
+
+
+# Memoized loads keyed by (path, mtime_ns, size): if the file on disk hasn't
+# changed, re-instantiating a TaskManager skips the read and the re-parse.
+# Entries share Task objects by reference -- cheap, and safe in the CLI's
+# one-manager-per-process world; any save changes the mtime and misses the cache.
+_LOAD_CACHE: Dict[tuple, Dict[str, Task]] = {}
+
+
 class TaskManager:
     """Manages task operations and persistence, or as I like to call it: 'The Wishful Thinking Machine'"""
 
     def __init__(self, storage_file: str = "tasks.json"):
         self.storage_file = storage_file  # Where your broken dreams are stored
-        self.tasks: Dict[str, Task] = {}  # An empty dict that will soon be filled with promises you won't keep
+        self._tasks: Optional[Dict[str, Task]] = None  # Hydrated lazily; None means "still just bytes"
+        self._records: Optional[List[Dict]] = None  # Raw parsed records, for paths that never need objects
+        self._cache_key = None  # Stat triple of the file these records came from
+        self._dirty = False  # Tracks unsaved changes, much like your conscience
+        self._batch_now: Optional[datetime.datetime] = None  # One clock read per batch; time flies, syscalls shouldn't
+        self._reset_indexes()  # Empty indexes for an empty life
         self.load_tasks()  # Load all those tasks you created and then abandoned
 
+    @property
+    def tasks(self) -> Dict[str, Task]:
+        """The id -> Task dict, hydrating from raw records on first touch.
+
+        Read-only consumers like the 'list' command go through iter_for_list
+        and never trigger this, so they never pay for N Task constructions.
+        """
+        tasks = self._tasks
+        if tasks is None:
+            tasks = self._hydrate_all()
+        return tasks
+
+    def _hydrate_all(self) -> Dict[str, Task]:
+        """Turn the raw records into Task objects, build the indexes, and
+        remember the result in the load cache for the next manager.
+
+        Hydration used to live inside load_tasks' error handling, so bad
+        records (unknown enum names, missing keys) still mean 'start fresh',
+        not a crash -- the bankruptcy option follows the debt around.
+        """
+        records = self._records or []
+        try:
+            # Batch-parse the three timestamp columns in one go; with numba
+            # installed this is a single compiled pass instead of 3N tiny parses
+            dues = _fast_iso.parse_iso_batch([r.get("due_date") for r in records])
+            createds = _fast_iso.parse_iso_batch([r["created_at"] for r in records])
+            updateds = _fast_iso.parse_iso_batch([r["updated_at"] for r in records])
+            tasks = {
+                r["id"]: Task._hydrate(r, due, created, updated)
+                for r, due, created, updated in zip(records, dues, createds, updateds)
+            }
+            if self._cache_key is not None:
+                _LOAD_CACHE[self._cache_key] = dict(tasks)  # Remember this for the next instantiation
+        except _DECODE_ERRORS as e:
+            print(f"Error loading tasks: {e}")  # Something went wrong, time to start fresh!
+            tasks = {}  # Task bankruptcy: the ultimate productivity hack (never cached)
+        self._tasks = tasks
+        self._records = None  # The dicts served their purpose; the objects take it from here
+        self._reset_indexes()
+        for task in tasks.values():
+            self._index_task(task)  # Rebuild the card catalog from scratch
+        return tasks
+
+    def _adopt_tasks(self, tasks: Dict[str, Task]) -> None:
+        """Install an already-hydrated task dict (cache hit) and index it."""
+        self._tasks = tasks
+        self._records = None
+        self._reset_indexes()
+        for task in tasks.values():
+            self._index_task(task)
+
+    def _reset_indexes(self) -> None:
+        """(Re)create the secondary indexes that keep list_tasks from re-sorting the world."""
+        self._by_status: Dict[Status, Set[str]] = {s: set() for s in Status}
+        self._by_priority: Dict[Priority, Set[str]] = {p: set() for p in Priority}
+        self._by_tag: Dict[str, Set[str]] = {}  # tag -> ids, for that organization system you never use
+        self._sorted = SortedList(key=_sort_key)  # Always in display order, so listing is just reading
+        self._cols = None  # Lazily-built SoA column mirror for vectorized filtering (numpy only)
+
+    def _index_task(self, task: Task) -> None:
+        """File a task into every index. Like a librarian, but for your regrets."""
+        self._by_status[task.status].add(task.id)
+        self._by_priority[task.priority].add(task.id)
+        for tag in task.tags:
+            self._by_tag.setdefault(tag, set()).add(task.id)
+        self._sorted.add(task)
+        self._cols = None  # The column mirror is now a lie; rebuild it on next use
+
+    def _unindex_task(self, task: Task) -> None:
+        """Remove a task from every index. Must run BEFORE the task mutates,
+        or the sorted list will be looking for it in the wrong place."""
+        self._by_status[task.status].discard(task.id)
+        self._by_priority[task.priority].discard(task.id)
+        for tag in task.tags:
+            ids = self._by_tag.get(tag)
+            if ids is not None:
+                ids.discard(task.id)
+                if not ids:
+                    del self._by_tag[tag]  # Nobody uses this tag anymore, just like you predicted
+        self._sorted.remove(task)
+        self._cols = None
+
+    def _columns(self):
+        """Return (and lazily build) the SoA mirror of the hot filter fields.
+
+        The Task dict is an array-of-structs: filtering drags every fat object
+        through cache just to peek at two attributes. This keeps a parallel
+        struct-of-arrays view -- a task snapshot list plus contiguous int8
+        columns of priority and status values -- so filters become one
+        vectorized compare over packed memory. Due dates are quantized to int64
+        microseconds-since-epoch and the display ordering is precomputed once
+        with np.lexsort, so no Python-level comparison ever runs at list time.
+        Rebuilt from scratch whenever a mutation invalidates it; for a
+        read-mostly store that's almost never.
+        """
+        cols = self._cols
+        if cols is None:
+            tasks = list(self.tasks.values())
+            n = len(tasks)
+            prio_col = np.fromiter((t.priority.value for t in tasks), dtype=np.int8, count=n)
+            stat_col = np.fromiter((t.status.value for t in tasks), dtype=np.int8, count=n)
+            due_col = np.fromiter(
+                ((t.due_date - _EPOCH) // _USEC if t.due_date else _NO_DUE for t in tasks),
+                dtype=np.int64, count=n
+            )
+            id_col = np.array([t.id for t in tasks])  # Tiebreaker, same as _sort_key
+            # lexsort's primary key goes last: priority desc, due asc, id asc
+            order = np.lexsort((id_col, due_col, -prio_col))
+            cols = self._cols = (tasks, prio_col, stat_col, order)
+        return cols
+
     def add_task(self, task: Task) -> str:
         """Add a new task and return its ID, like adding another book to your 'to read' pile"""
         self.tasks[task.id] = task
-        self.save_tasks()  # Persist to disk so you can ignore it forever
+        self._index_task(task)
+        self._dirty = True  # Note it for later instead of rewriting the whole file right now
         return task.id
 
+    def add_tasks(self, tasks) -> List[str]:
+        """Add a whole batch of tasks at once, for the truly ambitious procrastinator.
+        One flush at the end instead of one full-file rewrite per task."""
+        ids = [self.add_task(task) for task in tasks]
+        self.flush()
+        return ids
+
     def get_task(self, task_id: str) -> Optional[Task]:
         """Retrieve a task by ID, if you can even remember which one you're looking for"""
         return self.tasks.get(task_id)  # Returns None if not found, just like your motivation
@@ -152,22 +409,28 @@ class TaskManager:
 
         # Convert string values to enum types if necessary
         if "priority" in kwargs and isinstance(kwargs["priority"], str):
-            kwargs["priority"] = Priority[kwargs["priority"]]  # Magic string conversion
+            kwargs["priority"] = _PRIO[kwargs["priority"]]  # Magic string conversion
         if "status" in kwargs and isinstance(kwargs["status"], str):
-            kwargs["status"] = Status[kwargs["status"]]  # More magic
+            kwargs["status"] = _STATUS[kwargs["status"]]  # More magic
         if "due_date" in kwargs and isinstance(kwargs["due_date"], str):
             kwargs["due_date"] = datetime.datetime.fromisoformat(kwargs["due_date"])  # Even more magic
 
-        task.update(**kwargs)  # Update all the things
-        self.save_tasks()  # Save to disk so you can forget about it again
+        if self._batch_now is None:
+            self._batch_now = datetime.datetime.now()  # First update in this batch pays the clock_gettime toll
+        self._unindex_task(task)  # Pull it out of the indexes before its sort key shifts under us
+        task.update(now=self._batch_now, **kwargs)  # Update all the things
+        self._index_task(task)  # And file it back under its new identity
+        self._dirty = True  # Remember to save eventually, unlike your other commitments
         return True
 
     def delete_task(self, task_id: str) -> bool:
         """Delete a task by ID, the easiest way to complete your TODO list"""
-        if task_id not in self.tasks:
+        task = self.tasks.get(task_id)
+        if task is None:
             return False
+        self._unindex_task(task)
         del self.tasks[task_id]  # Poof! Problem solved
-        self.save_tasks()
+        self._dirty = True
         return True
 
     def list_tasks(
@@ -176,161 +439,386 @@ class TaskManager:
         priority: Optional[Priority] = None,
         tag: Optional[str] = None
     ) -> List[Task]:
-        """List tasks with optional filtering, for when you want to feel bad about all the things you haven't done"""
-        tasks = list(self.tasks.values())  # Convert dict to list because Python
-        
+        """List tasks with optional filtering, for when you want to feel bad about all the things you haven't done.
+        The indexes do the heavy lifting: filters become set intersections and the result
+        comes straight out of the always-sorted list -- no per-call re-sort of your entire backlog."""
+        if self._tasks is None:
+            self._hydrate_all()  # The indexes only exist once the objects do
+
+        if np is not None and (status is not None or priority is not None):
+            # Vectorized path: one SIMD-friendly compare over packed int8 columns
+            # beats per-object attribute chasing once stores get big
+            tasks_snapshot, prio_col, stat_col, order = self._columns()
+            mask = None
+            if status is not None:
+                mask = stat_col == status.value
+            if priority is not None:
+                prio_mask = prio_col == priority.value
+                mask = prio_mask if mask is None else mask & prio_mask
+            # Walk the precomputed ordering, keep the rows the mask likes:
+            # already sorted, no Python-level comparisons anywhere
+            picked = [tasks_snapshot[i] for i in order[mask[order]]]
+            if tag:
+                tag_ids = self._by_tag.get(tag)
+                if not tag_ids:
+                    return []
+                picked = [t for t in picked if t.id in tag_ids]
+            return picked
+
+        candidate_sets = []
         if status:
-            tasks = [t for t in tasks if t.status == status]  # Filter by status because browsing ALL your failed tasks is too depressing
+            candidate_sets.append(self._by_status[status])  # Filter by status because browsing ALL your failed tasks is too depressing
         if priority:
-            tasks = [t for t in tasks if t.priority == priority]  # Filter by priority because you only care about what's on fire right now
+            candidate_sets.append(self._by_priority[priority])  # Filter by priority because you only care about what's on fire right now
         if tag:
-            tasks = [t for t in tasks if tag in t.tags]  # Filter by tag because you created a complex tagging system and now have to live with it
-            
-        # Sort by priority (highest first) then due date (earliest first)
-        return sorted(
-            sorted(
-                tasks,
-                key=lambda t: t.due_date or datetime.datetime.max  # Sort by due date, or the end of time if not specified
-            ),
-            key=lambda t: t.priority.value,
-            reverse=True  # Highest priority first, because who cares about the LOW ones
-        )
+            candidate_sets.append(self._by_tag.get(tag, set()))  # Filter by tag because you created a complex tagging system and now have to live with it
+
+        if not candidate_sets:
+            return list(self._sorted)  # No filters? The whole parade of shame, pre-sorted.
+
+        candidate_sets.sort(key=len)  # Intersect smallest-first, so the cheap set does the gatekeeping
+        if not candidate_sets[0]:
+            return []  # Smallest set is empty: short-circuit before touching anything else
+        if len(candidate_sets) == 1:
+            ids = candidate_sets[0]  # One filter, zero intersections, zero extra sets
+        else:
+            ids = candidate_sets[0].intersection(*candidate_sets[1:])
+            if not ids:
+                return []
+        # Walk the sorted list once; membership test is O(1), order comes for free
+        return [t for t in self._sorted if t.id in ids]
+
+    def flush(self) -> None:
+        """Write pending changes to disk, but only if there are any.
+        The batching trick: N mutations, one rewrite, instead of N rewrites of the whole file."""
+        if self._dirty:
+            self.save_tasks()
+            self._dirty = False  # Clean slate, at least as far as the disk knows
+        self._batch_now = None  # Next batch gets a fresh idea of what time it is
 
     def save_tasks(self) -> None:
-        """Persist tasks to storage file, so you can ignore them on disk instead of just in memory"""
-        with open(self.storage_file, 'w') as f:
-            json.dump({
-                "tasks": [task.to_dict() for task in self.tasks.values()]
-            }, f, indent=2)  # Pretty print with indent=2 because we're not savages
+        """Persist tasks to storage file, so you can ignore them on disk instead of just in memory.
+        Serializes everything into one bytes blob, writes it with a single write() call,
+        then atomically renames over the old file -- so a crash mid-save can't eat your tasks
+        (the universe will have to find another way)."""
+        payload = orjson.dumps({
+            "tasks": [task.to_dict() for task in self.tasks.values()]
+        }, option=_DUMP_OPTS)  # Compact by default: nobody reads tasks.json for fun
+
+        tmp_file = self.storage_file + ".tmp"  # The understudy that's about to get promoted
+        fd = os.open(tmp_file, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+        try:
+            os.write(fd, payload)  # One syscall, not a thousand tiny ones
+            os.fsync(fd)  # Make the OS pinky-promise it's actually on disk
+        finally:
+            os.close(fd)
+        os.replace(tmp_file, self.storage_file)  # Atomic swap: all-or-nothing, like your motivation
 
     def load_tasks(self) -> None:
-        """Load tasks from storage file, bringing back all those neglected responsibilities"""
-        if not os.path.exists(self.storage_file):
-            self.tasks = {}  # No file? No tasks! Freedom!
+        """Load tasks from storage file, bringing back all those neglected responsibilities.
+
+        Only reads and JSON-decodes here; turning records into Task objects is
+        deferred until someone actually touches .tasks, because the read-only
+        paths never need the objects at all.
+        """
+        try:
+            st = os.stat(self.storage_file)
+        except FileNotFoundError:
+            self._tasks = {}  # No file? No tasks! Freedom!
+            return
+
+        cache_key = (self.storage_file, st.st_mtime_ns, st.st_size)
+        cached = _LOAD_CACHE.get(cache_key)
+        if cached is not None:
+            self._adopt_tasks(dict(cached))  # Same bytes on disk, same tasks in memory, zero parsing
             return
 
         try:
-            with open(self.storage_file, 'r') as f:
-                data = json.load(f)
-                self.tasks = {
-                    task_data["id"]: Task.from_dict(task_data)
-                    for task_data in data.get("tasks", [])
-                }
-        except (json.JSONDecodeError, KeyError) as e:
+            with open(self.storage_file, 'rb') as f:
+                self._records = _decode_records(f.read())
+            self._cache_key = cache_key
+            self._tasks = None  # Hydration happens on demand, like your motivation
+        except _DECODE_ERRORS as e:
             print(f"Error loading tasks: {e}")  # Something went wrong, time to start fresh!
-            self.tasks = {}  # Task bankruptcy: the ultimate productivity hack
+            self._tasks = {}  # Task bankruptcy: the ultimate productivity hack
+            self._records = None
 
+    def iter_for_list(
+        self,
+        status: Optional[str] = None,
+        priority: Optional[str] = None,
+        tag: Optional[str] = None
+    ):
+        """Yield (id, title, status, priority, due) display tuples, cheaply.
+
+        The 'list' command only prints a few string fields, so when the tasks
+        haven't been hydrated yet we filter and sort the raw record dicts
+        directly -- no Task objects, no timestamp parsing, nothing the output
+        doesn't need. ISO strings sort chronologically all by themselves, and
+        '~' outranks every digit, so missing due dates sink to the bottom just
+        like in the object path. Once tasks ARE hydrated (or came from the load
+        cache), we go through list_tasks and its indexes instead.
+        """
+        if self._tasks is not None or self._records is None:
+            for t in self.list_tasks(
+                status=_STATUS[status] if status else None,
+                priority=_PRIO[priority] if priority else None,
+                tag=tag
+            ):
+                due = t.due_date
+                yield (t.id, t.title, t.status.name, t.priority.name,
+                       due.strftime('%Y-%m-%d %H:%M') if due else None)
+            return
 
-class TodoApp:
-    """Enterprise TODO List Application, for when a sticky note just isn't corporate enough"""
+        try:
+            rows = [
+                r for r in self._records
+                if (status is None or r["status"] == status)
+                and (priority is None or r["priority"] == priority)
+                and (tag is None or tag in r["tags"])
+            ]
+            rows.sort(key=lambda r: (-_PRIO_ORDER[r["priority"]], r.get("due_date") or '~', r["id"]))
+        except _DECODE_ERRORS as e:
+            # Same bankruptcy as the hydration path: bad records mean an empty
+            # store and the familiar error line, not a crash mid-listing
+            print(f"Error loading tasks: {e}")
+            self._tasks = {}
+            self._records = None
+            return
+        for r in rows:
+            due = r.get("due_date")
+            yield (r["id"], r["title"], r["status"], r["priority"],
+                   f"{due[0:10]} {due[11:16]}" if due else None)
+
+
+def _create_parser() -> argparse.ArgumentParser:
+    """Build the command-line argument parser, with more options than you'll ever use"""
+    parser = argparse.ArgumentParser(
+        description='Enterprise-grade TODO List Application (because Excel sheets are for amateurs)'
+    )
+    subparsers = parser.add_subparsers(dest='command', help='Command to execute (or ignore, your choice)')
+
+    # Add task command
+    add_parser = subparsers.add_parser('add', help='Add a new task (to ignore later)')
+    add_parser.add_argument('title', help='Task title (make it sound important)')
+    add_parser.add_argument('-d', '--description', help='Task description (where excuses go to die)')
+    add_parser.add_argument(
+        '-p', '--priority',
+        choices=_PRIORITY_CHOICES,
+        default=Priority.MEDIUM.name,
+        help='Task priority (how badly you want to avoid it)'
+    )
+    add_parser.add_argument(
+        '--due', help='Due date and time (YYYY-MM-DD HH:MM) (that you\'ll definitely miss)'
+    )
+    add_parser.add_argument(
+        '-t', '--tags', help='Comma-separated list of tags (to create an illusion of organization)'
+    )
+
+    # List tasks command
+    list_parser = subparsers.add_parser('list', help='List tasks (and feel guilty)')
+    list_parser.add_argument(
+        '-s', '--status',
+        choices=_STATUS_CHOICES,
+        help='Filter by status (protip: NOT_STARTED will show most of them)'
+    )
+    list_parser.add_argument(
+        '-p', '--priority',
+        choices=_PRIORITY_CHOICES,
+        help='Filter by priority (as if you care about the LOW ones)'
+    )
+    list_parser.add_argument(
+        '-t', '--tag', help='Filter by tag (that complex system you created and immediately abandoned)'
+    )
+
+    # View task command
+    view_parser = subparsers.add_parser('view', help='View task details (and weep)')
+    view_parser.add_argument('id', help='Task ID (that impossible-to-remember UUID)')
+
+    # Update task command
+    update_parser = subparsers.add_parser('update', help='Update a task (procrastinate more efficiently)')
+    update_parser.add_argument('id', help='Task ID (good luck remembering it)')
+    update_parser.add_argument('-T', '--title', help='New task title (because priorities change, am I right?)')
+    update_parser.add_argument('-d', '--description', help='New task description (time for a better excuse)')
+    update_parser.add_argument(
+        '-p', '--priority',
+        choices=_PRIORITY_CHOICES,
+        help='New task priority (probably increasing to HIGH as the deadline approaches)'
+    )
+    update_parser.add_argument(
+        '-s', '--status',
+        choices=_STATUS_CHOICES,
+        help='New task status (optimistically set to IN_PROGRESS)'
+    )
+    update_parser.add_argument(
+        '--due', help='New due date and time (YYYY-MM-DD HH:MM) (pushing it back again, aren\'t you?)'
+    )
+    update_parser.add_argument(
+        '-t', '--tags', help='New comma-separated list of tags (reorganizing your never-used tagging system)'
+    )
+
+    # Complete task command (shorthand for update status=COMPLETED)
+    complete_parser = subparsers.add_parser('complete', help='Mark a task as completed (sure you did)')
+    complete_parser.add_argument('id', help='Task ID (of something you probably delegated)')
+
+    # Delete task command
+    delete_parser = subparsers.add_parser('delete', help='Delete a task (the easy way out)')
+    delete_parser.add_argument('id', help='Task ID (because deletion is easier than completion)')
+
+    return parser
+
+
+# Fast-path CLI table: per command, its positionals, its flag -> attribute map,
+# and the defaults argparse would have filled in. A one-shot CLI spends most of
+# its wall clock building hundreds of argparse objects to parse five tokens;
+# for well-formed invocations this table and a tiny loop do the same job.
+# Anything unusual (-h, unknown flags, abbreviations) falls back to argparse.
+_CLI_SPEC = {
+    'add': (
+        ('title',),
+        {'-d': 'description', '--description': 'description',
+         '-p': 'priority', '--priority': 'priority',
+         '--due': 'due', '-t': 'tags', '--tags': 'tags'},
+        {'description': None, 'priority': Priority.MEDIUM.name, 'due': None, 'tags': None},
+    ),
+    'list': (
+        (),
+        {'-s': 'status', '--status': 'status',
+         '-p': 'priority', '--priority': 'priority',
+         '-t': 'tag', '--tag': 'tag'},
+        {'status': None, 'priority': None, 'tag': None},
+    ),
+    'view': (('id',), {}, {}),
+    'update': (
+        ('id',),
+        {'-T': 'title', '--title': 'title',
+         '-d': 'description', '--description': 'description',
+         '-p': 'priority', '--priority': 'priority',
+         '-s': 'status', '--status': 'status',
+         '--due': 'due', '-t': 'tags', '--tags': 'tags'},
+        {'title': None, 'description': None, 'priority': None,
+         'status': None, 'due': None, 'tags': None},
+    ),
+    'complete': (('id',), {}, {}),
+    'delete': (('id',), {}, {}),
+}
+
+
+def _fast_parse(argv: List[str]) -> Optional[argparse.Namespace]:
+    """Parse a straightforward invocation without waking argparse up.
+
+    Returns a Namespace matching what parse_args would have produced, or None
+    for anything off the happy path -- help requests, unknown flags, missing
+    values, bad choices -- so argparse can deliver its usual error messages
+    and nobody notices we took the shortcut.
+    """
+    if not argv:
+        return None
+    spec = _CLI_SPEC.get(argv[0])
+    if spec is None:
+        return None  # Unknown command or -h; argparse gets to do the talking
+    positionals, flags, defaults = spec
+    values = dict(defaults)
+    values['command'] = argv[0]
+    pos_index = 0
+    i = 1
+    n = len(argv)
+    while i < n:
+        tok = argv[i]
+        if tok.startswith('-') and len(tok) > 1:
+            if tok.startswith('--') and '=' in tok:
+                tok, _, inline = tok.partition('=')  # --due=... style
+                dest = flags.get(tok)
+                if dest is None:
+                    return None
+                values[dest] = inline
+                i += 1
+                continue
+            dest = flags.get(tok)
+            if dest is None or i + 1 >= n:
+                return None  # Unknown flag (or -h, or a flag missing its value)
+            value = argv[i + 1]
+            if value.startswith('-') and len(value) > 1:
+                return None  # Flag-like value: argparse decides whether that's an error
+            values[dest] = value
+            i += 2
+        else:
+            if pos_index >= len(positionals):
+                return None  # More positionals than the command takes
+            values[positionals[pos_index]] = tok
+            pos_index += 1
+            i += 1
+    if pos_index < len(positionals):
+        return None  # Required positional missing; argparse words it better
+    if values.get('priority') is not None and values['priority'] not in _PRIO:
+        return None  # Bad choice: let argparse print the list of valid ones
+    if values.get('status') is not None and values['status'] not in _STATUS:
+        return None
+    return argparse.Namespace(**values)
 
-    def __init__(self):
-        self.task_manager = TaskManager()  # The keeper of broken promises
-        self.parser = self._create_parser()  # CLI parser, because we're too good for a GUI
 
-    def _create_parser(self) -> argparse.ArgumentParser:
-        """Create command-line argument parser, with more options than you'll ever use"""
-        parser = argparse.ArgumentParser(
-            description='Enterprise-grade TODO List Application (because Excel sheets are for amateurs)'
-        )
-        subparsers = parser.add_subparsers(dest='command', help='Command to execute (or ignore, your choice)')
-
-        # Add task command
-        add_parser = subparsers.add_parser('add', help='Add a new task (to ignore later)')
-        add_parser.add_argument('title', help='Task title (make it sound important)')
-        add_parser.add_argument('-d', '--description', help='Task description (where excuses go to die)')
-        add_parser.add_argument(
-            '-p', '--priority',
-            choices=[p.name for p in Priority],
-            default=Priority.MEDIUM.name,
-            help='Task priority (how badly you want to avoid it)'
-        )
-        add_parser.add_argument(
-            '--due', help='Due date and time (YYYY-MM-DD HH:MM) (that you\'ll definitely miss)'
-        )
-        add_parser.add_argument(
-            '-t', '--tags', help='Comma-separated list of tags (to create an illusion of organization)'
-        )
+_PARSER: Optional[argparse.ArgumentParser] = None  # Built once, reused forever, like a good excuse
 
-        # List tasks command
-        list_parser = subparsers.add_parser('list', help='List tasks (and feel guilty)')
-        list_parser.add_argument(
-            '-s', '--status',
-            choices=[s.name for s in Status],
-            help='Filter by status (protip: NOT_STARTED will show most of them)'
-        )
-        list_parser.add_argument(
-            '-p', '--priority',
-            choices=[p.name for p in Priority],
-            help='Filter by priority (as if you care about the LOW ones)'
-        )
-        list_parser.add_argument(
-            '-t', '--tag', help='Filter by tag (that complex system you created and immediately abandoned)'
-        )
 
-        # View task command
-        view_parser = subparsers.add_parser('view', help='View task details (and weep)')
-        view_parser.add_argument('id', help='Task ID (that impossible-to-remember UUID)')
-
-        # Update task command
-        update_parser = subparsers.add_parser('update', help='Update a task (procrastinate more efficiently)')
-        update_parser.add_argument('id', help='Task ID (good luck remembering it)')
-        update_parser.add_argument('-T', '--title', help='New task title (because priorities change, am I right?)')
-        update_parser.add_argument('-d', '--description', help='New task description (time for a better excuse)')
-        update_parser.add_argument(
-            '-p', '--priority',
-            choices=[p.name for p in Priority],
-            help='New task priority (probably increasing to HIGH as the deadline approaches)'
-        )
-        update_parser.add_argument(
-            '-s', '--status',
-            choices=[s.name for s in Status],
-            help='New task status (optimistically set to IN_PROGRESS)'
-        )
-        update_parser.add_argument(
-            '--due', help='New due date and time (YYYY-MM-DD HH:MM) (pushing it back again, aren\'t you?)'
-        )
-        update_parser.add_argument(
-            '-t', '--tags', help='New comma-separated list of tags (reorganizing your never-used tagging system)'
-        )
+def _get_parser() -> argparse.ArgumentParser:
+    """Return the shared ArgumentParser, building it on first request.
+
+    Constructing ~30 argparse actions is pure object churn, and the parser is
+    read-only after construction, so every TodoApp instance can share one.
+    """
+    global _PARSER
+    if _PARSER is None:
+        _PARSER = _create_parser()
+    return _PARSER
 
-        # Complete task command (shorthand for update status=COMPLETED)
-        complete_parser = subparsers.add_parser('complete', help='Mark a task as completed (sure you did)')
-        complete_parser.add_argument('id', help='Task ID (of something you probably delegated)')
 
-        # Delete task command
-        delete_parser = subparsers.add_parser('delete', help='Delete a task (the easy way out)')
-        delete_parser.add_argument('id', help='Task ID (because deletion is easier than completion)')
+class TodoApp:
+    """Enterprise TODO List Application, for when a sticky note just isn't corporate enough"""
+
+    def __init__(self):
+        self.task_manager = TaskManager()  # The keeper of broken promises
+        self._dispatch = {  # Command -> handler, built once: O(1) lookup beats an if/elif conga line
+            'add': self._handle_add,
+            'list': self._handle_list,
+            'view': self._handle_view,
+            'update': self._handle_update,
+            'complete': self._handle_complete,
+            'delete': self._handle_delete,
+        }
 
-        return parser
+    @property
+    def parser(self) -> argparse.ArgumentParser:
+        """The argparse parser, summoned lazily -- the fast path never needs it,
+        so well-formed invocations never pay for its construction."""
+        return _get_parser()
 
     def run(self, args: Optional[List[str]] = None) -> None:
         """Run the application with the given arguments, or crash trying"""
-        parsed_args = self.parser.parse_args(args)
-        
+        if args is None:
+            args = sys.argv[1:]
+        parsed_args = _fast_parse(args)  # The scenic route around argparse
+        if parsed_args is None:
+            parsed_args = self.parser.parse_args(args)  # Off the happy path: do it properly
+
         if not parsed_args.command:
             self.parser.print_help()  # If no command, show help and exit (the equivalent of "I don't know what I'm doing")
             return
 
-        if parsed_args.command == 'add':
-            self._handle_add(parsed_args)  # Add another item you'll never do
-        elif parsed_args.command == 'list':
-            self._handle_list(parsed_args)  # Stare at your failures
-        elif parsed_args.command == 'view':
-            self._handle_view(parsed_args)  # Look at one particular failure in detail
-        elif parsed_args.command == 'update':
-            self._handle_update(parsed_args)  # Reschedule, reprioritize, reword, repeat
-        elif parsed_args.command == 'complete':
-            self._handle_complete(parsed_args)  # Lie to yourself about getting something done
-        elif parsed_args.command == 'delete':
-            self._handle_delete(parsed_args)  # The ultimate form of task completion
+        try:
+            handler = self._dispatch.get(parsed_args.command)  # One hash lookup, zero string-compare conga
+            if handler:
+                handler(parsed_args)
+            else:
+                self.parser.print_help()  # Unknown command? argparse should have caught you, but just in case
+        finally:
+            self.task_manager.flush()  # One write per invocation, no matter how much you fiddled
 
     def _handle_add(self, args: argparse.Namespace) -> None:
         """Handle 'add' command, or as I call it, 'add to my pile of shame'"""
         due_date = None
         if args.due:
             try:
-                due_date = datetime.datetime.strptime(args.due, '%Y-%m-%d %H:%M')  # Parse date in a very specific format because flexibility is for the weak
+                due_date = _parse_due(args.due)  # Specialized parser: no strptime format re-interpretation tax
             except ValueError:
                 print("Error: Due date must be in the format 'YYYY-MM-DD HH:MM' (computers are so picky)")
                 return
@@ -342,7 +830,7 @@ class TodoApp:
         task = Task(
             title=args.title,
             description=args.description or "",
-            priority=Priority[args.priority],
+            priority=_PRIO[args.priority],
             due_date=due_date,
             tags=tags
         )
@@ -352,22 +840,19 @@ class TodoApp:
 
     def _handle_list(self, args: argparse.Namespace) -> None:
         """Handle 'list' command, AKA 'show me my mountain of obligations'"""
-        status = Status[args.status] if args.status else None
-        priority = Priority[args.priority] if args.priority else None
-        
-        tasks = self.task_manager.list_tasks(
-            status=status,
-            priority=priority,
+        rows = list(self.task_manager.iter_for_list(
+            status=args.status,
+            priority=args.priority,
             tag=args.tag
-        )
+        ))
 
-        if not tasks:
+        if not rows:
             print("No tasks found. Congratulations or you're looking in the wrong place.")
             return
 
-        print(f"Found {len(tasks)} tasks (that's {len(tasks)} too many):")
-        for i, task in enumerate(tasks, 1):
-            print(f"{i}. {task.id}: {task.title} - {task.status.name}")
+        print(f"Found {len(rows)} tasks (that's {len(rows)} too many):")
+        for i, (task_id, title, status_name, _priority, _due) in enumerate(rows, 1):
+            print(f"{i}. {task_id}: {title} - {status_name}")
 
     def _handle_view(self, args: argparse.Namespace) -> None:
         """Handle 'view' command, for when you want to see one failure in excruciating detail"""
@@ -397,16 +882,14 @@ class TodoApp:
         if args.description is not None:
             update_kwargs['description'] = args.description
         if args.priority is not None:
-            update_kwargs['priority'] = Priority[args.priority]
+            update_kwargs['priority'] = _PRIO[args.priority]
         if args.status is not None:
-            update_kwargs['status'] = Status[args.status]
+            update_kwargs['status'] = _STATUS[args.status]
         
         if args.due is not None:
             if args.due:
                 try:
-                    update_kwargs['due_date'] = datetime.datetime.strptime(
-                        args.due, '%Y-%m-%d %H:%M'  # Again with this format. Sorry, not sorry.
-                    )
+                    update_kwargs['due_date'] = _parse_due(args.due)  # Again with this format. Sorry, not sorry.
                 except ValueError:
                     print("Error: Due date must be in the format 'YYYY-MM-DD HH:MM' (computers, so literal)")
                     return